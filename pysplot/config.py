@@ -4,8 +4,10 @@ DARK_BG: str = "#1e1e1e"
 DARK_TEXT: str = "#e0e0e0"
 
 BUFF_SIZE: int = 1000
-UPDATE_INTERVAL: int = 1
+DEFAULT_BAUDRATE: int = 115200
+REFRESH_INTERVAL: int = 16
 SERIAL_TIMEOUT: float = 0.1
+STDIN_TIMEOUT: float = 0.1
 AUTOSCALE_SAMPLES: int = 10
 SKIP_INITIAL_SAMPLES: int = 5
 
@@ -2,7 +2,6 @@ import argparse
 import sys
 from typing import Optional
 
-import numpy as np
 import pyqtgraph as pg
 import serial
 import serial.tools.list_ports
@@ -12,6 +11,7 @@ from pysplot.config import (
     DARK_BG,
     DARK_TEXT,
     BUFF_SIZE,
+    DEFAULT_BAUDRATE,
 )
 from pysplot.workers import SerialWorker, StdinWorker
 from pysplot.ui import StackedPlotsWindow
@@ -29,8 +29,8 @@ def parse_args() -> argparse.Namespace:
         "-b",
         "--baudrate",
         type=int,
-        default=115200,
-        help="Baud rate (default: 115200)",
+        default=DEFAULT_BAUDRATE,
+        help=f"Baud rate (default: {DEFAULT_BAUDRATE})",
     )
     parser.add_argument(
         "-s",
@@ -50,7 +50,7 @@ def get_port(port_arg: Optional[str]) -> str:
     usb_ports = [
         p.device
         for p in serial.tools.list_ports.comports()
-        if "USB" in p.device or "ACM" in p.device
+        if p.device.startswith(("/dev/ttyUSB", "/dev/ttyACM"))
     ]
     if not usb_ports:
         print("Error: No USB ports found")
@@ -68,6 +68,14 @@ def main() -> None:
     app = QtWidgets.QApplication([])
     pg.setConfigOption("background", DARK_BG)
     pg.setConfigOption("foreground", DARK_TEXT)
+    # The experimental GL curve painter imports PyOpenGL on every paint, and it is optional
+    try:
+        import OpenGL.GL  # noqa: F401
+
+        have_pyopengl = True
+    except Exception:
+        have_pyopengl = False
+    pg.setConfigOptions(antialias=False, useOpenGL=True, enableExperimental=have_pyopengl)
 
     args = parse_args()
     baudrate = args.baudrate
@@ -99,10 +107,6 @@ def main() -> None:
     worker.moveToThread(thread)
     thread.started.connect(worker.run)
 
-    def on_data_received(values: np.ndarray) -> None:
-        """Update plots with new data."""
-        window.update_data(values)
-
     def on_error(msg: str) -> None:
         """Handle worker errors."""
         print(f"Error: {msg}")
@@ -113,9 +117,9 @@ def main() -> None:
             print(f"Resizing window for {num_signals_actual} signals")
             window.num_signals = num_signals_actual
             window.resize(1000, 100 + 150 * num_signals_actual)
-            window.sample_buffers = np.zeros((num_signals_actual, buff_size))
+            window.reset_buffers(num_signals_actual)
 
-    worker.data_received.connect(on_data_received)
+    worker.data_received.connect(window.update_data)
     worker.error_occurred.connect(on_error)
     if hasattr(worker, "signals_detected"):
         worker.signals_detected.connect(on_signals_detected)
@@ -1,4 +1,5 @@
 import datetime
+from collections import deque
 import numpy as np
 import pyqtgraph as pg
 from PyQt6 import QtWidgets, QtCore, QtGui
@@ -7,6 +8,7 @@ from pysplot.config import (
     DARK_BG,
     DARK_TEXT,
     BUFF_SIZE,
+    REFRESH_INTERVAL,
     AUTOSCALE_SAMPLES,
     SKIP_INITIAL_SAMPLES,
     DEFAULT_DELIMITER,
@@ -26,13 +28,12 @@ class StackedPlotsWindow(QtWidgets.QMainWindow):
 
         self.sample_count = 0
         self.autoscale_applied = False
-        self.autoscale_samples: list[np.ndarray] = []
         self.autoscale_enabled = True
 
-        self.frozen_buffer: list[np.ndarray] = []
         self.max_frozen_buffer = 100000
+        self.frozen_buffer: deque[np.ndarray] = deque(maxlen=self.max_frozen_buffer)
 
-        self.plot_visible = [True] * num_signals
+        self.plot_visible = np.ones(num_signals, dtype=bool)
         self.plot_containers: list[
             tuple[QtWidgets.QWidget, pg.PlotWidget, QtWidgets.QPushButton, QtWidgets.QWidget]
         ] = []
@@ -111,12 +112,18 @@ class StackedPlotsWindow(QtWidgets.QMainWindow):
         scroll_layout.setContentsMargins(0, 0, 0, 0)
         scroll_layout.setSpacing(0)
 
+        self.reset_buffers(num_signals)
+        # Shared by every curve; a y-only setData would build a new arange per curve per frame
         self.x_axis = np.arange(buff_size)
-        self.sample_buffers = np.zeros((num_signals, buff_size))
 
         self.plots: list[pg.PlotWidget] = []
         self.curves: list[pg.PlotDataItem] = []
 
+        axis_pen = pg.mkPen(color=DARK_TEXT, width=1)
+        self.curve_pens = [
+            pg.mkPen(pg.intColor(i, hues=num_signals), width=1) for i in range(num_signals)
+        ]
+
         for i in range(num_signals):
             plot_container = QtWidgets.QWidget()
             plot_layout = QtWidgets.QVBoxLayout(plot_container)
@@ -157,11 +164,15 @@ class StackedPlotsWindow(QtWidgets.QMainWindow):
             plot_widget = pg.PlotWidget()
             plot_widget.getViewBox().setBackgroundColor(DARK_BG)
             plot_widget.showGrid(x=True, y=True, alpha=0.2)
+            plot_widget.setDownsampling(auto=True, mode="peak")
+            plot_widget.setClipToView(True)
+            # The x extent never changes, so skip auto-ranging it on every redraw
+            plot_widget.setXRange(0, buff_size - 1, padding=0)
 
-            plot_widget.getAxis("left").setPen(pg.mkPen(color=DARK_TEXT, width=1))
-            plot_widget.getAxis("left").setTextPen(pg.mkPen(color=DARK_TEXT))
-            plot_widget.getAxis("bottom").setPen(pg.mkPen(color=DARK_TEXT, width=1))
-            plot_widget.getAxis("bottom").setTextPen(pg.mkPen(color=DARK_TEXT))
+            plot_widget.getAxis("left").setPen(axis_pen)
+            plot_widget.getAxis("left").setTextPen(axis_pen)
+            plot_widget.getAxis("bottom").setPen(axis_pen)
+            plot_widget.getAxis("bottom").setTextPen(axis_pen)
 
             if i == num_signals - 1:
                 plot_widget.setLabel("bottom", "Sample", color=DARK_TEXT)
@@ -172,8 +183,7 @@ class StackedPlotsWindow(QtWidgets.QMainWindow):
             plot_widget.setMaximumHeight(500)
             plot_widget.setMinimumHeight(80)
 
-            color = pg.intColor(i, hues=num_signals)
-            curve = plot_widget.plot(pen=color)
+            curve = plot_widget.plot(pen=self.curve_pens[i], connect="all", skipFiniteCheck=True)
 
             plot_layout.addWidget(plot_widget, 1)
 
@@ -208,6 +218,11 @@ class StackedPlotsWindow(QtWidgets.QMainWindow):
         central.setStyleSheet(f"QWidget {{ background-color: {DARK_BG}; color: {DARK_TEXT}; }}")
         self.setStyleSheet(f"QMainWindow {{ background-color: {DARK_BG}; color: {DARK_TEXT}; }}")
 
+        self.needs_redraw = False
+        self.refresh_timer = QtCore.QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh_plots)
+        self.refresh_timer.start(REFRESH_INTERVAL)
+
     def setup_resize_handler(
         self,
         container: QtWidgets.QWidget,
@@ -276,10 +291,14 @@ class StackedPlotsWindow(QtWidgets.QMainWindow):
 
     def toggle_plot_visibility(self, index: int) -> None:
         """Toggle visibility of a plot."""
-        self.plot_visible[index] = not self.plot_visible[index]
+        visible = not self.plot_visible[index]
+        self.plot_visible[index] = visible
         container, plot_widget, min_btn, resize_handle = self.plot_containers[index]
+        self.curves[index].setVisible(visible)
 
-        if self.plot_visible[index]:
+        if visible:
+            # Hidden curves skip setData, so bring this one up to date before showing it
+            self.curves[index].setData(self.x_axis, self.ordered_buffers()[index])
             plot_widget.show()
             resize_handle.show()
             min_btn.setText("−")
@@ -294,46 +313,44 @@ class StackedPlotsWindow(QtWidgets.QMainWindow):
         self.export_btn.setVisible(checked)
         if checked:
             self.freeze_btn.setText("Frozen")
+            # Nothing new is drawn while frozen, so flush pending data and stop redrawing
+            self.refresh_plots()
+            self.refresh_timer.stop()
         else:
             self.freeze_btn.setText("Freeze")
-            for frozen_sample in self.frozen_buffer:
-                self.update_data(frozen_sample)
+            if self.frozen_buffer:
+                self.update_data(np.array(self.frozen_buffer))
             self.frozen_buffer.clear()
+            self.refresh_timer.start(REFRESH_INTERVAL)
+
+    def fit_y_ranges(self, y_data: np.ndarray) -> None:
+        """Fit each visible plot to its row of data, ignoring zeros unless a row is all zero."""
+        # Reduce every signal in one pass; the loop below only applies the results
+        nonzero = y_data != 0
+        y_min = np.min(y_data, axis=1, where=nonzero, initial=np.inf)
+        y_max = np.max(y_data, axis=1, where=nonzero, initial=-np.inf)
+        all_zero = ~nonzero.any(axis=1)
+        y_min[all_zero] = 0.0
+        y_max[all_zero] = 0.0
+        y_range = y_max - y_min
+        y_padding = np.where(y_range > 0, y_range * 0.1, 0.5)
+        lows = (y_min - y_padding).tolist()
+        highs = (y_max + y_padding).tolist()
+
+        for i in np.flatnonzero(self.plot_visible).tolist():
+            self.plots[i].setYRange(lows[i], highs[i])
 
     def apply_autoscale(self) -> None:
         """Apply autoscaling based on current buffer data."""
         if not self.autoscale_enabled:
             return
 
-        for i, plot in enumerate(self.plots):
-            if not self.plot_visible[i]:
-                continue
-
-            y_data = self.sample_buffers[i]
-            valid_data = y_data[y_data != 0] if np.any(y_data != 0) else y_data
-
-            if len(valid_data) > 0:
-                y_min, y_max = np.min(valid_data), np.max(valid_data)
-                y_range = y_max - y_min
-                y_padding = y_range * 0.1 if y_range > 0 else 0.5
-                plot.setYRange(y_min - y_padding, y_max + y_padding)
+        self.fit_y_ranges(self.ordered_buffers())
 
     def rescale_to_first_10_percent(self) -> None:
         """Rescale plots based on first 10% of samples in buffer."""
         num_samples_to_use = max(1, self.buff_size // 10)
-
-        for i, plot in enumerate(self.plots):
-            if not self.plot_visible[i]:
-                continue
-
-            y_data = self.sample_buffers[i, :num_samples_to_use]
-            valid_data = y_data[y_data != 0] if np.any(y_data != 0) else y_data
-
-            if len(valid_data) > 0:
-                y_min, y_max = np.min(valid_data), np.max(valid_data)
-                y_range = y_max - y_min
-                y_padding = y_range * 0.1 if y_range > 0 else 0.5
-                plot.setYRange(y_min - y_padding, y_max + y_padding)
+        self.fit_y_ranges(self.ordered_buffers()[:, :num_samples_to_use])
 
         print(
             f"Rescaled to first {num_samples_to_use} samples ({num_samples_to_use / self.buff_size * 100:.1f}% of buffer)"
@@ -343,33 +360,60 @@ class StackedPlotsWindow(QtWidgets.QMainWindow):
         """Handle rescale button click."""
         self.rescale_to_first_10_percent()
 
+    def reset_buffers(self, num_signals: int) -> None:
+        """Allocate an empty ring buffer for the given number of signals."""
+        # Each ring is stored twice back to back so any window of buff_size is contiguous
+        self.sample_buffers = np.zeros((num_signals, 2 * self.buff_size), dtype=np.float32)
+        self.write_idx = 0
+
+    def ordered_buffers(self) -> np.ndarray:
+        """Return a view of the ring buffer unrolled so that the newest sample is first."""
+        return self.sample_buffers[:, self.write_idx : self.write_idx + self.buff_size]
+
     def update_data(self, values: np.ndarray) -> None:
-        """Update all plots with new data."""
-        if len(values) != self.num_signals:
-            return
+        """Store new samples in the buffer; plots are redrawn by the refresh timer.
 
+        Expects a non-empty 2D batch with one sample per row, oldest first. Workers only
+        emit samples that already match ``num_signals``.
+        """
         if self.frozen:
-            self.frozen_buffer.append(values.copy())
-            if len(self.frozen_buffer) > self.max_frozen_buffer:
-                self.frozen_buffer.pop(0)
+            self.frozen_buffer.extend(values)
             return
 
         if not self.autoscale_applied:
-            self.sample_count += 1
-
-            if self.sample_count > SKIP_INITIAL_SAMPLES:
-                self.autoscale_samples.append(values.copy())
-
-            if len(self.autoscale_samples) == AUTOSCALE_SAMPLES:
+            # Autoscale starts once the skipped and warm-up samples have been seen
+            self.sample_count += len(values)
+            if self.sample_count >= SKIP_INITIAL_SAMPLES + AUTOSCALE_SAMPLES:
                 print(
                     f"Autoscale enabled based on samples {SKIP_INITIAL_SAMPLES + 1}-{SKIP_INITIAL_SAMPLES + AUTOSCALE_SAMPLES}"
                 )
                 self.autoscale_applied = True
 
-        self.sample_buffers = np.column_stack([values, self.sample_buffers[:, :-1]])
+        # Filled backwards so the unrolled view keeps the newest sample first
+        newest_first = values[-self.buff_size :][::-1].T
+        size = self.buff_size
+        start = (self.write_idx - newest_first.shape[1]) % size
+        end = start + newest_first.shape[1]
 
-        for i, curve in enumerate(self.curves):
-            curve.setData(self.x_axis, self.sample_buffers[i])
+        # Write the primary copy, then mirror it into the other half with plain slices
+        self.sample_buffers[:, start:end] = newest_first
+        if end <= size:
+            self.sample_buffers[:, start + size : end + size] = newest_first
+        else:
+            self.sample_buffers[:, start + size :] = newest_first[:, : size - start]
+            self.sample_buffers[:, : end - size] = newest_first[:, size - start :]
+        self.write_idx = start
+        self.needs_redraw = True
+
+    def refresh_plots(self) -> None:
+        """Redraw all plots if new data arrived since the last refresh."""
+        if not self.needs_redraw:
+            return
+        self.needs_redraw = False
+
+        ordered = self.ordered_buffers()
+        for i in np.flatnonzero(self.plot_visible).tolist():
+            self.curves[i].setData(self.x_axis, ordered[i])
 
         if self.autoscale_enabled and self.autoscale_applied:
             self.apply_autoscale()
@@ -384,13 +428,12 @@ class StackedPlotsWindow(QtWidgets.QMainWindow):
         )
         if ok and filename:
             try:
-                np.savetxt(
-                    filename,
-                    self.sample_buffers.T,
-                    delimiter=",",
-                    header=",".join(f"Signal {i + 1}" for i in range(self.num_signals)),
-                    comments="",
-                )
+                data = self.ordered_buffers().T
+                header = ",".join(f"Signal {i + 1}" for i in range(self.num_signals))
+                # One format operation for the whole table; 9 digits round-trip float32 exactly
+                row_fmt = ",".join(["%.9g"] * self.num_signals) + "\n"
+                with open(filename, "w") as f:
+                    f.write(header + "\n" + (row_fmt * len(data)) % tuple(data.ravel().tolist()))
                 print(f"Data exported: {filename}")
             except Exception as e:
                 print(f"Error exporting data: {e}")
@@ -2,22 +2,84 @@ import sys
 import time
 import os
 import fcntl
+import selectors
 import numpy as np
 import serial
 import serial.tools.list_ports
 from PyQt6 import QtCore
 
 from pysplot.config import (
-    UPDATE_INTERVAL,
     SERIAL_TIMEOUT,
+    STDIN_TIMEOUT,
     DELIMITER_OPTIONS,
     DEFAULT_DELIMITER,
 )
 
 
+def detect_delimiter(line: str) -> str:
+    """Auto-detect delimiter as the most frequent of tab, comma or semicolon, else space."""
+    # Spaces are often just padding around another delimiter, so they only count on their own
+    counts = {delim: line.count(delim) for delim in DELIMITER_OPTIONS if delim != " "}
+    best = max(counts, key=counts.__getitem__)
+    if counts[best]:
+        return best
+    return " " if " " in line else DEFAULT_DELIMITER
+
+
+def split_fields(line: str, delimiter: str) -> list[str]:
+    """Split a line into fields, treating runs of whitespace as one space delimiter."""
+    return line.split(None if delimiter == " " else delimiter)
+
+
+def parse_lines(lines: list[bytes], delimiter: str, num_signals: int) -> np.ndarray:
+    """Parse delimited lines into a (samples, num_signals) array, skipping malformed lines.
+
+    The result is read-only so receivers can keep views into it without copying.
+    """
+    batch = None
+    # loadtxt warns on input without data, so blank-only batches go straight to the loop below
+    if any(map(bytes.strip, lines)):
+        # Fast path: parse the whole batch in one C call; any malformed line makes it raise
+        try:
+            batch = np.loadtxt(
+                lines,
+                dtype=np.float32,
+                delimiter=None if delimiter == " " else delimiter,
+                comments=None,
+                ndmin=2,
+            )
+        except ValueError:
+            pass
+
+    if batch is None or batch.shape[1] != num_signals:
+        batch = np.empty((len(lines), num_signals), dtype=np.float32)
+        count = 0
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            # Lines with the wrong number of fields still parse, so check the size
+            try:
+                values = np.fromstring(line, dtype=np.float32, sep=delimiter)
+            except ValueError:
+                continue
+            if values.size == num_signals:
+                batch[count] = values
+                count += 1
+        batch = batch[:count]
+
+    # Curves skip pyqtgraph's finite check, so nan/inf samples must not reach them
+    finite = np.isfinite(batch).all(axis=1)
+    if not finite.all():
+        batch = batch[finite]
+    batch.setflags(write=False)
+    return batch
+
+
 class SerialWorker(QtCore.QObject):
     """Worker thread for non-blocking serial communication."""
 
+    # Emits one (samples, num_signals) batch per read
     data_received = QtCore.pyqtSignal(np.ndarray)  # type: ignore[assignment]
     error_occurred = QtCore.pyqtSignal(str)  # type: ignore[assignment]
 
@@ -29,62 +91,49 @@ class SerialWorker(QtCore.QObject):
         except serial.SerialException as e:
             self.error_occurred.emit(f"Serial error: {e}")
             raise
-        self.queue: list[np.ndarray] = []
         self.running = True
-        self.delimiter: str | None = None
-
-    @staticmethod
-    def detect_delimiter(line: str) -> str:
-        """Auto-detect delimiter (tab, comma, or space)."""
-        for delim in DELIMITER_OPTIONS:
-            if delim in line:
-                return delim
-        return DEFAULT_DELIMITER
+        self.delimiter = DEFAULT_DELIMITER
+        self.num_signals = 0
+        self.buffer = b""
 
     def detect_signals(self) -> int:
         """Read first line to determine number of signals and delimiter."""
         max_attempts = 100
         attempts = 0
         while self.running and attempts < max_attempts:
-            try:
-                line = self.ser.readline().decode().strip()
-                if line:
-                    self.delimiter = self.detect_delimiter(line)
-                    num = len(line.split(self.delimiter))
-                    print(f"Detected {num} signal(s) with delimiter: {repr(self.delimiter)}")
-                    return num
-            except (UnicodeDecodeError, ValueError):
-                pass
+            # Latin-1 maps every byte, so a garbled byte cannot make decoding fail
+            line = self.ser.readline().decode("latin-1").strip()
+            if line:
+                self.delimiter = detect_delimiter(line)
+                num = len(split_fields(line, self.delimiter))
+                print(f"Detected {num} signal(s) with delimiter: {repr(self.delimiter)}")
+                self.num_signals = num
+                return num
             attempts += 1
         print(
             f"Warning: Could not auto-detect signals, assuming 1 with {repr(DEFAULT_DELIMITER)} delimiter"
         )
         self.delimiter = DEFAULT_DELIMITER
+        self.num_signals = 1
         return 1
 
     def run(self) -> None:
-        """Main worker loop - continuously read serial data into queue."""
+        """Main worker loop - continuously read serial data and emit it in batches."""
         while self.running:
             try:
-                while self.ser.in_waiting:
-                    line = self.ser.readline().decode().strip()
-                    if line:
-                        try:
-                            values = np.array(
-                                [float(v.strip()) for v in line.split(self.delimiter)]
-                            )
-                            self.queue.append(values)
-                        except (ValueError, IndexError):
-                            pass
-
-                while self.queue:
-                    self.data_received.emit(self.queue.pop(0))
-
-                QtCore.QThread.msleep(UPDATE_INTERVAL)
-            except UnicodeDecodeError:
-                pass
+                # Block for the first byte (bounded by the serial timeout), then drain the rest
+                data = self.ser.read(1)
+                if not data:
+                    continue
+                data += self.ser.read(self.ser.in_waiting)
+                lines = (self.buffer + data).split(b"\n")
+                self.buffer = lines.pop()
+                batch = parse_lines(lines, self.delimiter, self.num_signals)
+                if len(batch):
+                    self.data_received.emit(batch)
             except Exception as e:
-                self.error_occurred.emit(f"Worker error: {e}")
+                if self.running:
+                    self.error_occurred.emit(f"Worker error: {e}")
 
     def stop(self) -> None:
         """Stop worker and close serial port."""
@@ -96,16 +145,17 @@ class SerialWorker(QtCore.QObject):
 class StdinWorker(QtCore.QObject):
     """Worker thread for reading from piped stdin."""
 
+    # Emits one (samples, num_signals) batch per read
     data_received = QtCore.pyqtSignal(np.ndarray)  # type: ignore[assignment]
     error_occurred = QtCore.pyqtSignal(str)  # type: ignore[assignment]
 
     def __init__(self) -> None:
         super().__init__()
-        self.queue: list[np.ndarray] = []
         self.running = True
-        self.delimiter: str | None = None
+        self.delimiter = DEFAULT_DELIMITER
+        self.num_signals = 0
         self.fd = sys.stdin.fileno()
-        self.buffer = ""
+        self.buffer = bytearray()
 
         try:
             flags = fcntl.fcntl(self.fd, fcntl.F_GETFL)
@@ -113,13 +163,9 @@ class StdinWorker(QtCore.QObject):
         except Exception as e:
             print(f"Warning: Could not set non-blocking mode: {e}")
 
-    @staticmethod
-    def detect_delimiter(line: str) -> str:
-        """Auto-detect delimiter (tab, comma, or space)."""
-        for delim in DELIMITER_OPTIONS:
-            if delim in line:
-                return delim
-        return DEFAULT_DELIMITER
+        # select() also accepts redirected regular files, which epoll rejects
+        self.selector = selectors.SelectSelector()
+        self.selector.register(self.fd, selectors.EVENT_READ)
 
     def detect_signals(self) -> int:
         """Blocking wait for first line to determine signal count."""
@@ -129,24 +175,25 @@ class StdinWorker(QtCore.QObject):
             try:
                 chunk = os.read(self.fd, 4096)
                 if chunk:
-                    self.buffer += chunk.decode("utf-8", errors="ignore")
+                    self.buffer += chunk
 
-                    if "\n" in self.buffer:
-                        line, remainder = self.buffer.split("\n", 1)
-                        line = line.strip()
-                        self.buffer = remainder
+                    end = self.buffer.find(b"\n")
+                    if end >= 0:
+                        line = bytes(self.buffer[:end]).strip()
+                        del self.buffer[: end + 1]
 
                         if line:
-                            self.delimiter = self.detect_delimiter(line)
+                            text = line.decode("latin-1")
+                            self.delimiter = detect_delimiter(text)
                             try:
-                                values = np.array(
-                                    [float(v.strip()) for v in line.split(self.delimiter)]
-                                )
+                                values = [float(v) for v in split_fields(text, self.delimiter)]
                                 count = len(values)
                                 print(
                                     f"Detected {count} signals with delimiter: {repr(self.delimiter)}"
                                 )
-                                self.queue.append(values)
+                                self.num_signals = count
+                                # Leave the line buffered so run() emits it as the first sample
+                                self.buffer[:0] = line + b"\n"
                                 return count
                             except ValueError:
                                 pass
@@ -157,46 +204,33 @@ class StdinWorker(QtCore.QObject):
                 time.sleep(0.01)
             except Exception as e:
                 print(f"Error detecting signals: {e}")
+                self.num_signals = 1
                 return 1
 
     def run(self) -> None:
-        """Main worker loop - continuously read stdin data."""
+        """Main worker loop - continuously read stdin data and emit it in batches."""
         while self.running:
             try:
-                raw_data = b""
-                while True:
+                # Sleep until stdin is readable (bounded so stop() is noticed), then read once
+                if self.selector.select(timeout=STDIN_TIMEOUT):
                     try:
-                        chunk = os.read(self.fd, 8192)
-                        if not chunk:
-                            break
-                        raw_data += chunk
+                        chunk = os.read(self.fd, 65536)
                     except BlockingIOError:
-                        break
-                    except Exception:
-                        break
-
-                if raw_data:
-                    self.buffer += raw_data.decode("utf-8", errors="ignore")
-
-                while "\n" in self.buffer:
-                    line, self.buffer = self.buffer.split("\n", 1)
-                    line = line.strip()
-                    if line:
-                        try:
-                            values = np.array(
-                                [
-                                    float(v.strip())
-                                    for v in line.split(self.delimiter or DEFAULT_DELIMITER)
-                                ]
-                            )
-                            self.queue.append(values)
-                        except (ValueError, IndexError):
-                            pass
-
-                while self.queue:
-                    self.data_received.emit(self.queue.pop(0))
-
-                time.sleep(0.001)
+                        chunk = None
+                    if chunk:
+                        self.buffer += chunk
+                    elif chunk is not None:
+                        # End of input: flush an unterminated last line and stop watching stdin
+                        self.selector.unregister(self.fd)
+                        self.buffer += b"\n"
+
+                end = self.buffer.rfind(b"\n")
+                if end >= 0:
+                    lines = bytes(self.buffer[:end]).split(b"\n")
+                    del self.buffer[: end + 1]
+                    batch = parse_lines(lines, self.delimiter, self.num_signals)
+                    if len(batch):
+                        self.data_received.emit(batch)
 
             except Exception as e:
                 self.error_occurred.emit(f"Worker error: {e}")